@@ -25,56 +25,80 @@ import sys
 
 sys.path.append('..')
 
-import time
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import tkinter as tk
 from tkinter import ttk as tkttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 import numpy as np
 import json
-import webbrowser
 import multiprocessing
 from llm4ad.gui import main_gui
-import threading
+
+# fork avoids the child's cold re-import of llm4ad, but is only safe on
+# Linux: on macOS forking after Tk/AppKit are initialized crashes, and
+# Windows only has spawn; in both cases the parent's module cache at least
+# warms the OS page cache
+mp_context = multiprocessing.get_context('fork' if sys.platform == 'linux' else 'spawn')
 import ttkbootstrap as ttk
 import subprocess
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader  # LibYAML C binding, much faster
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+try:
+    from orjson import loads as json_loads  # native parser, several times faster on sample logs
+except ImportError:
+    json_loads = json.loads
+
 ##########################################################
 
 selected_algo = None
 selected_problem = None
 
 process1 = None
-thread1 = None
 
 stop_thread = False
-have_stop_thread = False
+poll_interval_ms = 500
+poll_after_id = None
 
 method_para_entry_list = []
 method_para_value_type_list = []
 method_para_value_name_list = []
+method_para_name = None
 
 problem_listbox = None
 default_problem_index = None
 objectives_var = None
+algo_param_container = None
+problem_param_container = None
 problem_para_entry_list = []
 problem_para_value_type_list = []
 problem_para_value_name_list = []
+problem_para_name = None
 
 llm_para_entry_list = []
 llm_para_value_name_list = ['name', 'host', 'key', 'model']
 llm_para_default_value_list = ['HttpsApi', '', '', '']
 llm_para_placeholder_list = ['HttpsApi', 'api.bltcy.top', 'sk-xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx', 'gpt-4o-mini']
 
+listbox_font = ('Comic Sans MS', 12)
+plot_font = {
+    'family': 'Times New Roman',
+    'size': 16
+}
+
 default_method = 'eoh'
-default_problem = ['admissible_set', 'car_mountain', 'bactgrow']
+default_problem = frozenset(['admissible_set', 'car_mountain', 'bactgrow'])
 
 log_dir = None
+plt = None
+FigureCanvasTkAgg = None
 figures = None
 ax = None
+line1 = None
 canvas = None
 
 ##########################################################
@@ -149,19 +173,25 @@ def draw_horizontal_line(parent_frame, width=150):
 
 
 def open_doc_link():
-    webbrowser.open_new("https://llm4ad-doc.readthedocs.io/en/latest/")
+    # webbrowser probes for browser binaries at import time, so only the first
+    # click on one of these buttons pays for it instead of every GUI start
+    import webbrowser
+    webbrowser.open_new_tab("https://llm4ad-doc.readthedocs.io/en/latest/")
 
 
 def open_github_link():
-    webbrowser.open_new("https://github.com/Optima-CityU/LLM4AD")
+    import webbrowser
+    webbrowser.open_new_tab("https://github.com/Optima-CityU/LLM4AD")
 
 
 def open_website_link():
-    webbrowser.open_new("http://www.llm4ad.com/index.html")
+    import webbrowser
+    webbrowser.open_new_tab("http://www.llm4ad.com/index.html")
 
 
 def open_qq_link():
-    webbrowser.open_new("https://qm.qq.com/cgi-bin/qm/qr?k=4Imf8bn_d99-QXVcEJfOwCSD1KkcpbcD&jump_from=webapi&authKey=JtSmFh8BNKM97+TGnUdDgvT69TDTbo4UaLwgrZJSlsYqmVoCca/a5awU+TXt4zYB")
+    import webbrowser
+    webbrowser.open_new_tab("https://qm.qq.com/cgi-bin/qm/qr?k=4Imf8bn_d99-QXVcEJfOwCSD1KkcpbcD&jump_from=webapi&authKey=JtSmFh8BNKM97+TGnUdDgvT69TDTbo4UaLwgrZJSlsYqmVoCca/a5awU+TXt4zYB")
 
 
 def open_folder():
@@ -176,57 +206,101 @@ def open_folder():
 
 ##########################################################
 
+select_debounce_ms = 50
+algo_select_after_id = None
+problem_select_after_id = None
+
+
 def on_algo_select(event):
     global selected_algo
+    global algo_select_after_id
     if algo_listbox.curselection():
         selected_algo = algo_listbox.get(algo_listbox.curselection())
-        show_algorithm_parameters(selected_algo)
+        # coalesce rapid selection changes (arrow keys, mouse drags) into one rebuild
+        if algo_select_after_id is not None:
+            root.after_cancel(algo_select_after_id)
+        algo_select_after_id = root.after(select_debounce_ms, show_selected_algorithm)
+
+
+def show_selected_algorithm():
+    global algo_select_after_id
+    algo_select_after_id = None
+    show_algorithm_parameters(selected_algo)
 
 
 def on_problem_select(event):
     global selected_problem
+    global problem_select_after_id
     if problem_listbox.curselection():
         selected_problem = problem_listbox.get(problem_listbox.curselection())
-        show_problem_parameters(selected_problem)
+        if problem_select_after_id is not None:
+            root.after_cancel(problem_select_after_id)
+        problem_select_after_id = root.after(select_debounce_ms, show_selected_problem)
+
+
+def show_selected_problem():
+    global problem_select_after_id
+    problem_select_after_id = None
+    show_problem_parameters(selected_problem)
+
+
+algo_param_rows = []
+problem_param_rows = []
 
 
 def show_algorithm_parameters(algo_name):
     global method_para_entry_list
     global method_para_value_type_list
     global method_para_value_name_list
-    clear_algo_param_frame()
+    global method_para_name
+    global algo_param_container
 
     algo_param_frame['text'] = f"{algo_name}"
 
     required_parameters, value_type, default_value = get_required_parameters(
         path=f"../llm4ad/method/{algo_name}/paras.yaml")
-    method_para_value_name_list = required_parameters
-    method_para_value_type_list = value_type
-
-    # Create scrollable area within algo_param_frame
-    scroll_frame = ScrollableFrame(algo_param_frame, max_height=200)
-    scroll_frame.pack(fill='both', expand=True)
-    inner_frame = scroll_frame.scrollable_frame
-
-    for i in range(len(required_parameters)):
-        if i != 0:
-            ttk.Label(inner_frame, text=required_parameters[i] + ':').grid(row=i - 1, column=0, sticky='w', padx=5,
-                                                                           pady=5)
-        method_para_entry_list.append(ttk.Entry(inner_frame, width=10, bootstyle="primary"))
-        if i != 0:
-            method_para_entry_list[-1].grid(row=i - 1, column=1, sticky='ew', padx=5, pady=5)
-        if default_value[i] is not None:
-            method_para_entry_list[-1].insert(0, str(default_value[i]))
+    # the leading 'name' field is never shown; remember its value instead of
+    # parking it in a hidden Entry widget
+    method_para_name = default_value[0]
+    method_para_value_name_list = required_parameters[1:]
+    method_para_value_type_list = value_type[1:]
+    default_value = default_value[1:]
+
+    # Create the scrollable area once; later clicks only update the pooled rows
+    if algo_param_container is None:
+        algo_param_container = ScrollableFrame(algo_param_frame, max_height=200)
+        algo_param_container.pack(fill='both', expand=True)
+        algo_param_container.scrollable_frame.grid_columnconfigure(0, weight=1)
+        algo_param_container.scrollable_frame.grid_columnconfigure(1, weight=2)
+    inner_frame = algo_param_container.scrollable_frame
+
+    # ttk widget creation is the expensive part of a click, so rows are pooled
+    # and reused instead of being destroyed and rebuilt on every selection
+    while len(algo_param_rows) < len(method_para_value_name_list):
+        algo_param_rows.append((ttk.Label(inner_frame),
+                                ttk.Entry(inner_frame, width=10, bootstyle="primary")))
 
-    inner_frame.grid_columnconfigure(0, weight=1)
-    inner_frame.grid_columnconfigure(1, weight=2)
+    method_para_entry_list = []
+    for i, (label, entry) in enumerate(algo_param_rows):
+        if i < len(method_para_value_name_list):
+            entry.delete(0, 'end')
+            if default_value[i] is not None:
+                entry.insert(0, default_value[i])
+            method_para_entry_list.append(entry)
+            label['text'] = method_para_value_name_list[i] + ':'
+            label.grid(row=i, column=0, sticky='w', padx=5, pady=5)
+            entry.grid(row=i, column=1, sticky='ew', padx=5, pady=5)
+        else:
+            label.grid_remove()
+            entry.grid_remove()
 
 
 def show_problem_parameters(problem_name):
     global problem_para_entry_list
     global problem_para_value_type_list
     global problem_para_value_name_list
-    clear_problem_param_frame()
+    global problem_para_name
+    global problem_param_container
 
     problem_param_frame['text'] = f"{problem_name}"
 
@@ -236,64 +310,76 @@ def show_problem_parameters(problem_name):
         yaml_file_path = f"../llm4ad/task/{objectives_var.get()}/{problem_name}/paras.yaml"
 
     required_parameters, value_type, default_value = get_required_parameters(path=yaml_file_path)
-    problem_para_value_type_list = value_type
-    problem_para_value_name_list = required_parameters
-    for i in range(len(required_parameters)):
-        if i != 0:
-            ttk.Label(problem_param_frame, text=required_parameters[i] + ':').grid(row=i - 1, column=0, sticky='nsew', padx=5, pady=10)
-        problem_para_entry_list.append(ttk.Entry(problem_param_frame, width=10, bootstyle="warning"))
-        if i != 0:
-            problem_para_entry_list[-1].grid(row=i - 1, column=1, sticky='nsew', padx=5, pady=10)
-            problem_param_frame.grid_rowconfigure(i - 1, weight=1)
-        if default_value[i] is not None:
-            problem_para_entry_list[-1].insert(0, str(default_value[i]))
-    problem_param_frame.grid_columnconfigure(0, weight=1)
-    problem_param_frame.grid_columnconfigure(1, weight=2)
+    problem_para_name = default_value[0]
+    problem_para_value_name_list = required_parameters[1:]
+    problem_para_value_type_list = value_type[1:]
+    default_value = default_value[1:]
+
+    if problem_param_container is None:
+        problem_param_container = ttk.Frame(problem_param_frame)
+        problem_param_container.pack(fill='both', expand=True)
+        problem_param_container.grid_columnconfigure(0, weight=1)
+        problem_param_container.grid_columnconfigure(1, weight=2)
 
-    if len(required_parameters) < 5:
-        for i in range(len(required_parameters), 5):
-            problem_param_frame.grid_rowconfigure(i - 1, weight=1)
+    while len(problem_param_rows) < len(problem_para_value_name_list):
+        problem_param_rows.append((ttk.Label(problem_param_container),
+                                   ttk.Entry(problem_param_container, width=10, bootstyle="warning")))
+
+    problem_para_entry_list = []
+    for i, (label, entry) in enumerate(problem_param_rows):
+        if i < len(problem_para_value_name_list):
+            entry.delete(0, 'end')
+            if default_value[i] is not None:
+                entry.insert(0, default_value[i])
+            problem_para_entry_list.append(entry)
+            label['text'] = problem_para_value_name_list[i] + ':'
+            label.grid(row=i, column=0, sticky='nsew', padx=5, pady=10)
+            entry.grid(row=i, column=1, sticky='nsew', padx=5, pady=10)
+        else:
+            label.grid_remove()
+            entry.grid_remove()
+
+    # keep at least four weighted rows so short parameter lists stay spread out
+    n_weighted = max(len(problem_para_value_name_list), 4)
+    for r in range(max(len(problem_param_rows), 4)):
+        problem_param_container.grid_rowconfigure(r, weight=1 if r < n_weighted else 0)
+
+
+paras_yaml_cache = {}
 
 
 def get_required_parameters(path):
+    # serve repeated listbox clicks from memory; re-parse only if the file changed
+    stat = os.stat(path)
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    cached = paras_yaml_cache.get(path)
+    if cached is not None and cached[0] == file_key:
+        return list(cached[1]), list(cached[2]), list(cached[3])
+
     required_parameters = []
     value_type = []
     default_value = []
 
-    with open(path, 'r', encoding='utf-8') as file:
-        data = yaml.safe_load(file)  # 使用 safe_load 读取 YAML 文件
+    with open(path, 'rb') as file:
+        data = yaml.load(file, Loader=YamlSafeLoader)
 
     for key, value in data.items():
         required_parameters.append(key)
-        value_type.append(str(type(value)))
+        value_type.append(type(value) if value is not None else str)
         if value is None:
             default_value.append(value)
         else:
             default_value.append(str(value))
 
-    return required_parameters, value_type, default_value
+    paras_yaml_cache[path] = (file_key, required_parameters, value_type, default_value)
+    return list(required_parameters), list(value_type), list(default_value)
 
 
-def clear_algo_param_frame():
-    global method_para_entry_list
-    global method_para_value_type_list
-    global method_para_value_name_list
-    method_para_value_type_list = []
-    method_para_value_name_list = []
-    method_para_entry_list = []
-    for widget in algo_param_frame.winfo_children():
-        widget.destroy()
-
-
-def clear_problem_param_frame():
-    global problem_para_entry_list
-    global problem_para_value_type_list
-    global problem_para_value_name_list
-    problem_para_value_type_list = []
-    problem_para_value_name_list = []
-    problem_para_entry_list = []
-    for widget in problem_param_frame.winfo_children():
-        widget.destroy()
+def list_subdirs(path, exclude=('__pycache__', '_data')):
+    # one scandir pass instead of os.walk/os.listdir + per-entry isdir stat
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=False) and entry.name not in exclude]
 
 
 def problem_type_select(event=None):
@@ -305,22 +391,16 @@ def problem_type_select(event=None):
     if problem_listbox is not None:
         problem_listbox.destroy()
 
-    problem_listbox = tk.Listbox(problem_frame, height=6, bg='white', selectbackground='lightgray', font=('Comic Sans MS', 12))
+    problem_listbox = tk.Listbox(problem_frame, height=6, bg='white', selectbackground='lightgray', font=listbox_font, exportselection=False)
     problem_listbox.pack(anchor=tk.NW, fill='both', expand=True, padx=5, pady=5)
     path = f'../llm4ad/task/{objectives_var.get()}'
-    for name in os.listdir(path):
-        full_path = os.path.join(path, name)
-        if os.path.isdir(full_path) and name != '__pycache__' and name != '_data' and name != 'co_bench':
-            problem_listbox.insert(tk.END, name)
-        if name in default_problem:
-            default_problem_index = problem_listbox.size() - 1
+    problem_names = list_subdirs(path, exclude=('__pycache__', '_data', 'co_bench'))
+    problem_listbox.insert(tk.END, *problem_names)
+    default_problem_index = next((i for i, name in enumerate(problem_names) if name in default_problem), None)
 
     if objectives_var.get() == 'optimization':
         path = f'../llm4ad/task/{objectives_var.get()}/co_bench'  # todo
-        for name in os.listdir(path):
-            full_path = os.path.join(path, name)
-            if os.path.isdir(full_path) and name != '__pycache__' and name != '_data':
-                problem_listbox.insert(tk.END, name)
+        problem_listbox.insert(tk.END, *list_subdirs(path))
 
     problem_listbox.bind("<<ListboxSelect>>", on_problem_select)
     on_problem_select(problem_listbox.select_set(default_problem_index))
@@ -330,7 +410,6 @@ def problem_type_select(event=None):
 
 def on_plot_button_click():
     global process1
-    global thread1
     global log_dir
 
     try:
@@ -343,11 +422,10 @@ def on_plot_button_click():
 
         init_fig(method_para['max_sample_nums'])
 
-        process1 = multiprocessing.Process(target=main_gui, args=(llm_para, method_para, problem_para, profiler_para))
+        process1 = mp_context.Process(target=main_gui, args=(llm_para, method_para, problem_para, profiler_para))
         process1.start()
 
-        thread1 = threading.Thread(target=get_results, args=(profiler_para['log_dir'], method_para['max_sample_nums'],), daemon=True)
-        thread1.start()
+        start_polling(profiler_para['log_dir'], method_para['max_sample_nums'])
 
         log_dir = profiler_para['log_dir']
 
@@ -367,6 +445,14 @@ def check_para():
     return True
 
 
+# entry values are cast back to the type of the yaml default they came from
+para_casters = {
+    int: int,
+    float: float,
+    bool: lambda text: text.lower() in ('1', 'true', 'yes'),
+}
+
+
 def return_para():
     llm_para = {}
     method_para = {}
@@ -378,17 +464,17 @@ def return_para():
     for i in range(len(llm_para_entry_list)):
         llm_para[llm_para_value_name_list[i]] = llm_para_entry_list[i].get()
 
+    method_para['name'] = method_para_name
     for i in range(len(method_para_entry_list)):
-        method_para[method_para_value_name_list[i]] = method_para_entry_list[i].get()
-        if method_para_value_type_list[i] == '<class \'int\'>':
-            method_para[method_para_value_name_list[i]] = int(method_para_entry_list[i].get())
+        caster = para_casters.get(method_para_value_type_list[i], str)
+        method_para[method_para_value_name_list[i]] = caster(method_para_entry_list[i].get())
 
     method_para['num_samplers'] = method_para['num_evaluators']
 
+    problem_para['name'] = problem_para_name
     for i in range(len(problem_para_entry_list)):
-        problem_para[problem_para_value_name_list[i]] = problem_para_entry_list[i].get()
-        if problem_para_value_type_list[i] == '<class \'int\'>':
-            problem_para[problem_para_value_name_list[i]] = int(problem_para_entry_list[i].get())
+        caster = para_casters.get(problem_para_value_type_list[i], str)
+        problem_para[problem_para_value_name_list[i]] = caster(problem_para_entry_list[i].get())
 
     ####################
 
@@ -396,10 +482,9 @@ def return_para():
 
     temp_str1 = problem_para['name']
     temp_str2 = method_para['name']
-    process_start_time = datetime.now(pytz.timezone("Asia/Shanghai"))
-    b = os.path.abspath('..')
-    log_folder = b + '/GUI/logs/' + process_start_time.strftime(
-        "%Y%m%d_%H%M%S") + f'_{temp_str1}' + f'_{temp_str2}'
+    process_start_time = datetime.now(ZoneInfo("Asia/Shanghai"))
+    log_folder = os.path.join(os.path.abspath('..'), 'GUI', 'logs',
+                              process_start_time.strftime("%Y%m%d_%H%M%S") + f'_{temp_str1}' + f'_{temp_str2}')
     profiler_para['log_dir'] = log_folder
 
     ####################
@@ -413,20 +498,31 @@ def return_para():
 
 ######################################################################
 
+def load_matplotlib():
+    # importing matplotlib costs hundreds of ms; pay for it on the first Run
+    # click instead of before the window can appear
+    global plt
+    global FigureCanvasTkAgg
+    if plt is None:
+        import matplotlib.pyplot
+        from matplotlib.backends import backend_tkagg
+        plt = matplotlib.pyplot
+        FigureCanvasTkAgg = backend_tkagg.FigureCanvasTkAgg
+
+
 def init_fig(max_sample_nums):
     global stop_thread
-    global have_stop_thread
-    global thread1
     global process1
     global ax
     global figures
     global canvas
+    global line1
 
+    load_matplotlib()
     stop_run()
     value_label.config(text=f"{0} samples")
 
     stop_thread = False
-    have_stop_thread = False
 
     right_frame_label['text'] = 'Running'
 
@@ -439,142 +535,160 @@ def init_fig(max_sample_nums):
     for widget in plot_frame.winfo_children():
         widget.destroy()
 
-    font = {
-        'family': 'Times New Roman',
-        'size': 16
-    }
-
     figures = plt.Figure(figsize=(4, 3), dpi=100)
     ax = figures.add_subplot(111)
 
     figures.patch.set_facecolor('white')
     ax.set_facecolor('white')
 
-    ax.set_title(f"Result Display", fontdict=font)
+    ax.set_title(f"Result Display", fontdict=plot_font)
 
-    ax.plot()
+    # one persistent line whose data is updated on every poll
+    line1, = ax.plot([], [], color='tab:blue')
     ax.set_xlim(left=0)
-    ax.set_xlabel('Samples', fontdict=font)
-    ax.set_ylabel('Current best objective', fontdict=font)
+    ax.set_xlabel('Samples', fontdict=plot_font)
+    ax.set_ylabel('Current best objective', fontdict=plot_font)
     ax.grid(True)
 
-    if max_sample_nums <= 20:
-        ax.set_xticks(np.arange(0, max_sample_nums + 1, 1))
-    else:
-        ticks = np.linspace(0, max_sample_nums, 11)
-        ticks = np.round(ticks).astype(int)
-        ax.set_xticks(ticks)
+    ax.set_xticks(sample_xticks(max_sample_nums))
 
     canvas = FigureCanvasTkAgg(figures, master=plot_frame)
     canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
-def get_results(log_dir, max_sample_nums):
-    global figures
-    global stop_thread
-    global have_stop_thread
-    index = 1
-
-    while (not stop_thread) and (not check_finish(log_dir, index, max_sample_nums)) and (not except_error()):
-        time.sleep(0.5)
-        new = check(index, log_dir)
-        if new:
-            try:
-                fig, alg, best_obj = plot_fig(index, log_dir, max_sample_nums)
-            except:
-                continue
-            display_plot(index - 1)
-            if alg is not None:
-                display_alg(alg)
-            objective_label['text'] = f'Current best objective:{best_obj}'
-            index += 1
-
-    if not stop_thread:
-        right_frame_label['text'] = 'Finished'
-        # doc_button['state'] = tk.NORMAL
+def start_polling(log_dir, max_sample_nums):
+    global poll_after_id
+    # the per-run paths are constants, so build them once instead of per poll
+    state = {
+        'log_dir': log_dir,
+        'samples_dir': os.path.join(log_dir, 'samples'),
+        'end_path': os.path.join(log_dir, 'population', 'end.json'),
+        'max_sample_nums': max_sample_nums,
+        'samples_count': 0,
+        'best_value_list': [],
+        'all_best_value': float('-inf'),
+        'best_alg': None,
+    }
+    poll_after_id = root.after(poll_interval_ms, poll_results, state)
 
-    if except_error():
-        tk.messagebox.showerror("Error", "Except Error. Please check the terminal.")
-        right_frame_label['text'] = 'Error'
 
-    have_stop_thread = True
-    plot_button['state'] = tk.NORMAL
-    stop_button['state'] = tk.DISABLED
+def poll_results(state):
+    global poll_after_id
+    poll_after_id = None
 
-def plot_fig(index, log_dir, max_sample_nums):
-    global figures
-    global ax
-    ###############################################################
-    generation = []
-    best_value_list = []
-    all_best_value = float('-inf')
-    best_alg = None
-
-    file_name_list = [log_dir + f'/samples/samples_{i * 200 + 1}~{(i + 1) * 200}.json' for i in range(((index - 1) // 200) + 1)]
-
-    data = []
-    for file_name in file_name_list:
-        with open(file_name) as file:
-            data.append(json.load(file))
-
-    for i in range(index):
-        individual = data[i // 200][((i+1) % 200)-1]
-        code = individual['function']
-        # alg = individual['algorithm']
-        obj = individual['score']
-        if obj is None:
-            generation.append(i + 1)
-            best_value_list.append(all_best_value)
-            continue
-        if obj > all_best_value:
-            all_best_value = obj
-            best_alg = code
-        generation.append(i + 1)
-        best_value_list.append(all_best_value)
-
-    generation = np.array(generation)
-    best_value_list = np.array(best_value_list)
-
-    ###############################################################
-    # plot
-
-    font = {
-        'family': 'Times New Roman',
-        'size': 16
-    }
+    if stop_thread:
+        return
+    if check_finish(state['end_path'], state['samples_count'] + 1, state['max_sample_nums']) or except_error():
+        finish_run()
+        return
 
-    figures.patch.set_facecolor('white')
-    ax.set_facecolor('white')
+    new_samples = fetch_new_samples(state['samples_dir'], state['samples_count'])
+    if new_samples:
+        state['samples_count'] += len(new_samples)
 
-    ax.set_title(f"Result display", fontdict=font)
+        # only the new tail is processed; the running best is carried across polls
+        scores = np.fromiter(
+            (individual['score'] if individual['score'] is not None else -np.inf for individual in new_samples),
+            dtype=np.float64, count=len(new_samples))
+        running_best = np.maximum.accumulate(np.maximum(scores, state['all_best_value']))
+        state['best_value_list'].extend(running_best.tolist())
+        if running_best[-1] > state['all_best_value']:
+            state['all_best_value'] = float(running_best[-1])
+            state['best_alg'] = new_samples[int(scores.argmax())]['function']
 
-    # ax.plot(generation, best_value_list, color='tab:blue', marker='o')
-    ax.plot(generation, best_value_list, color='tab:blue')
-    ax.set_xlabel('Samples', fontdict=font)
-    ax.set_ylabel('Current best objective', fontdict=font)
-    ax.grid(True)
+        plot_fig(state['best_value_list'], state['max_sample_nums'])
+        display_plot(state['samples_count'] - 1)
+        if state['best_alg'] is not None:
+            display_alg(state['best_alg'])
+        objective_label['text'] = f"Current best objective:{state['all_best_value']}"
 
-    if len(generation) <= max_sample_nums:
-        if max_sample_nums<=20:
-            ax.set_xticks(np.arange(0, max_sample_nums + 1, 1))
-        else:
-            ticks = np.linspace(0, max_sample_nums, 11)
-            ticks = np.round(ticks).astype(int)
-            ax.set_xticks(ticks)
+    poll_after_id = root.after(poll_interval_ms, poll_results, state)
+
+
+def finish_run():
+    if except_error():
+        tk.messagebox.showerror("Error", "Except Error. Please check the terminal.")
+        right_frame_label['text'] = 'Error'
     else:
-        if len(generation)<=20:
-            ax.set_xticks(np.arange(0, len(generation) + 1, 1))
+        right_frame_label['text'] = 'Finished'
+
+    plot_button['state'] = tk.NORMAL
+    stop_button['state'] = tk.DISABLED
+
+samples_file_key = None
+samples_file_data = None
+
+
+def load_samples_file(file_name):
+    # cheap stat gate: skip the JSON parse entirely when the file is unchanged
+    global samples_file_key
+    global samples_file_data
+    stat = os.stat(file_name)
+    key = (file_name, stat.st_mtime_ns, stat.st_size)
+    if key == samples_file_key:
+        return samples_file_data
+    with open(file_name, 'rb') as file:
+        data = json_loads(file.read())
+    samples_file_key = key
+    samples_file_data = data
+    return data
+
+
+def fetch_new_samples(samples_dir, samples_count):
+    """Return the samples logged after the first `samples_count` ones.
+
+    Samples are stored in 200-entry chunk files, so only the still-growing
+    tail file (plus any chunk completed since the last poll) is parsed.
+    """
+    new_samples = []
+    while True:
+        chunk = samples_count // 200
+        file_name = os.path.join(samples_dir, f'samples_{chunk * 200 + 1}~{(chunk + 1) * 200}.json')
+        if not os.path.exists(file_name):
+            break
+        try:
+            data = load_samples_file(file_name)
+        except (ValueError, OSError):
+            break  # the worker may be mid-write, retry on the next poll
+        offset = samples_count - chunk * 200
+        if len(data) <= offset:
+            break
+        new_samples.extend(data[offset:])
+        samples_count += len(data) - offset
+        if len(data) < 200:
+            break
+    return new_samples
+
+
+xticks_cache = {}
+
+
+def sample_xticks(max_sample_nums):
+    # the tick layout only depends on the sample count, so compute each one once
+    ticks = xticks_cache.get(max_sample_nums)
+    if ticks is None:
+        if max_sample_nums <= 20:
+            ticks = np.arange(0, max_sample_nums + 1, 1)
         else:
-            ticks = np.linspace(0, len(generation), 11)
-            ticks = np.round(ticks).astype(int)
-            ax.set_xticks(ticks)
+            ticks = np.round(np.linspace(0, max_sample_nums, 11)).astype(int)
+        xticks_cache[max_sample_nums] = ticks
+    return ticks
 
-    ###############################################################
 
-    return figures, best_alg, all_best_value
+def plot_fig(best_value_list, max_sample_nums):
+    # update the persistent line rather than rebuilding the axes every poll
+    generation = np.arange(1, len(best_value_list) + 1)
+    line1.set_data(generation, np.array(best_value_list))
+    ax.relim()
+    ax.autoscale_view()
+
+    # init_fig already laid out ticks for max_sample_nums; only extend beyond it
+    if len(generation) > max_sample_nums:
+        ax.set_xticks(sample_xticks(len(generation)))
 
 def display_plot(index):
     global canvas
-    canvas.draw()
+    # draw_idle coalesces redraws from the same Tk event cycle into one paint
+    canvas.draw_idle()
 
     value_label.config(text=f"{index + 1} samples")
 
@@ -588,59 +702,31 @@ def display_alg(alg):
 
 
 def except_error():
-    global process1
-    try:
-        if process1.exitcode == 1:
-            return True
-        else:
-            return False
-    except:
-        return False
+    return process1 is not None and process1.exitcode == 1
 
 
-def check_finish(log_dir, index, max_sample_nums):
-    return os.path.exists(log_dir + '/population/' + 'end.json') or index > max_sample_nums
+def check_finish(end_path, index, max_sample_nums):
+    return os.path.exists(end_path) or index > max_sample_nums
 
 
-def check(index, log_dir):
-    temp_var1 = (index - 1) // 200
-    return_value = False
-    file_name = log_dir + f'/samples/samples_{temp_var1*200+1}~{(temp_var1+1)*200}.json'
-
-    if os.path.exists(file_name):
-        with open(file_name) as file:
-            data = json.load(file)
-        if len(data) >= ((index-1) % 200)+1:
-            return_value = True
-    return return_value
-
-
-def stop_run_thread():
-    thread_stop = threading.Thread(target=stop_run)
-    thread_stop.start()
-
 def stop_run():
     global stop_thread
     global process1
-    global have_stop_thread
+    global poll_after_id
 
     # doc_button['state'] = tk.DISABLED
     stop_button['state'] = tk.DISABLED
     stop_thread = True
-    if process1 is not None:
-        if process1.is_alive():
-            try:
-                process1.terminate()
-            except:
-                pass
-    while (thread1 is not None) and (have_stop_thread is False):
-        time.sleep(0.5)
-        _ = 'stop'
+    if poll_after_id is not None:
+        root.after_cancel(poll_after_id)
+        poll_after_id = None
+    if process1 is not None and process1.is_alive():
+        process1.terminate()
     plot_button['state'] = tk.NORMAL
 
 
 def exit_run():
-    stop_run_thread()
+    stop_run()
     root.destroy()
     sys.exit(0)
 
@@ -742,42 +828,34 @@ if __name__ == '__main__':
 
     ############
 
-    algo_listbox = tk.Listbox(algo_frame, height=6, bg='white', selectbackground='lightgray', font=('Comic Sans MS', 12))
+    algo_listbox = tk.Listbox(algo_frame, height=6, bg='white', selectbackground='lightgray', font=listbox_font, exportselection=False)
     algo_listbox.pack(anchor=tk.NW, fill='both', expand=True, padx=5, pady=5)
-    default_method_index = None
-    path = '../llm4ad/method'
-    for name in os.listdir(path):
-        full_path = os.path.join(path, name)
-        if os.path.isdir(full_path) and name != '__pycache__':
-            algo_listbox.insert(tk.END, name)
-        if name == default_method:
-            default_method_index = algo_listbox.size() - 1
+    method_names = list_subdirs('../llm4ad/method', exclude=('__pycache__',))
+    # a single variadic insert needs one Tcl call instead of one per method
+    algo_listbox.insert(tk.END, *method_names)
+    default_method_index = method_names.index(default_method) if default_method in method_names else None
 
     algo_listbox.bind("<<ListboxSelect>>", on_algo_select)
-    on_algo_select(algo_listbox.select_set(default_method_index))
+    # defer the initial selection so the window paints before the frames populate
+    root.after_idle(lambda: on_algo_select(algo_listbox.select_set(default_method_index)))
 
     ############
 
     objectives_var = tk.StringVar(value="optimization")
     objectives_frame = tk.Frame(problem_frame, bg='white')
     objectives_frame.pack(anchor=tk.NW, pady=5)
-    radiobutton_list = []
-    for _, dict_name, _ in os.walk('../llm4ad/task'):
-        for name in dict_name:
-            if name != '__pycache__' and name != '_data':
-                radiobutton_list.append(name)
-        break
+    radiobutton_list = list_subdirs('../llm4ad/task')
     combobox = ttk.Combobox(objectives_frame, state='readonly', values=radiobutton_list, textvariable=objectives_var, bootstyle="warning", font=('Comic Sans MS', 12))
     combobox.bind('<<ComboboxSelected>>', problem_type_select)
     combobox.pack(anchor=tk.NW, padx=5, pady=5)
-    problem_type_select()
+    root.after_idle(problem_type_select)
 
     ############
 
     plot_button = ttk.Button(left_frame, text="Run", command=on_plot_button_click, width=12, bootstyle="primary-outline", state=tk.NORMAL)
     plot_button.pack(side='left', pady=20, expand=True)
 
-    stop_button = ttk.Button(left_frame, text="Stop", command=stop_run_thread, width=12, bootstyle="warning-outline", state=tk.DISABLED)
+    stop_button = ttk.Button(left_frame, text="Stop", command=stop_run, width=12, bootstyle="warning-outline", state=tk.DISABLED)
     stop_button.pack(side='left', pady=20, expand=True)
 
     doc_button = ttk.Button(left_frame, text="Log files", command=open_folder, width=12, bootstyle="dark-outline", state=tk.DISABLED)
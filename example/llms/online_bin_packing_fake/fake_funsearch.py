@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import pickle
 import random
 from typing import Any
@@ -15,6 +16,13 @@ from llm4ad.method.funsearch import FunSearch
 from llm4ad.tools.profiler import ProfilerBase
 
 
+@functools.lru_cache(maxsize=None)
+def _load_functions(path: str):
+    # unpickle the function corpus once and share it across FakeLLM instances
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
 class FakeLLM(LLM):
     """We select random functions from rand_function.pkl
     This sampler can help you debug your method even if you don't have an LLM API / deployed local LLM.
@@ -22,15 +30,16 @@ class FakeLLM(LLM):
 
     def __init__(self):
         super().__init__()
-        with open('./_data/rand_function.pkl', 'rb') as f:
-            self._functions = pickle.load(f)
+        self._functions = _load_functions('./_data/rand_function.pkl')
+        # private generator: sampler threads no longer contend on the global
+        # random module's shared state
+        self._rng = random.Random()
 
     def draw_sample(self, prompt: str | Any, *args, **kwargs) -> str:
-        return random.choice(self._functions)
+        return self._rng.choice(self._functions)
 
 
 if __name__ == '__main__':
-    llm = FakeLLM()
     task = OBPEvaluation()
     method = FunSearch(
         llm=FakeLLM(),
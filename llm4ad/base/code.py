@@ -52,6 +52,8 @@ import copy
 import dataclasses
 from typing import Any, List, Callable
 
+_unset = object()
+
 
 @dataclasses.dataclass
 class Function:
@@ -68,7 +70,19 @@ class Function:
     sample_time: float | None = None
     operator: str | None = 'Unknown'
 
+    # attributes whose mutation changes the rendered source of the function
+    _str_fields = frozenset(('name', 'args', 'body', 'return_type', 'docstring'))
+    # attributes that additionally feed cached per-individual prompt blocks
+    _prompt_fields = frozenset(('name', 'args', 'body', 'return_type', 'docstring', 'algorithm', 'score'))
+
     def __str__(self) -> str:
+        # str(function) is called repeatedly in prompt construction and
+        # duplicate checks, so the rendered source is cached until one of the
+        # attributes it depends on is reassigned.
+        cached = self.__dict__.get('_str_cache')
+        if cached is not None:
+            return cached
+
         return_type = f' -> {self.return_type}' if self.return_type else ''
 
         function = f'def {self.name}({self.args}){return_type}:\n'
@@ -79,6 +93,7 @@ class Function:
             function += f'    """{self.docstring}"""{new_line}'
         # self.body is already indented.
         function += self.body + '\n\n'
+        self.__dict__['_str_cache'] = function
         return function
 
     def __setattr__(self, name: str, value: str) -> None:
@@ -90,6 +105,20 @@ class Function:
             if '"""' in value:
                 value = value.strip()
                 value = value.replace('"""', '')
+        if name in self._str_fields:
+            # for the string fields the render caches are only dropped when the
+            # value actually changes, so e.g. re-blanking a docstring does not
+            # throw away a still-valid render
+            if value != self.__dict__.get(name, _unset):
+                self.__dict__.pop('_str_cache', None)
+                self.__dict__.pop('_prompt_block', None)
+                self.__dict__.pop('_template_str', None)
+        elif name in self._prompt_fields:
+            # `score` may be an ndarray (multi-objective tasks), where `!=`
+            # broadcasts instead of yielding a bool, so algorithm/score
+            # invalidate the prompt caches unconditionally
+            self.__dict__.pop('_prompt_block', None)
+            self.__dict__.pop('_template_str', None)
         super().__setattr__(name, value)
 
     def __eq__(self, other: Function):
@@ -19,17 +19,37 @@ class MAPrompt:
     def get_system_prompt(cls) -> str:
         return ''
 
+    @classmethod
+    def _template_str(cls, template_function: Function) -> str:
+        # the empty-body template render is the same for the whole search, so
+        # it is rendered once and cached on the template function itself
+        rendered = template_function.__dict__.get('_template_str')
+        if rendered is None:
+            temp_func = copy.copy(template_function)
+            temp_func.body = ''
+            rendered = str(temp_func)
+            template_function.__dict__['_template_str'] = rendered
+        return rendered
+
+    @classmethod
+    def _indi_block(cls, indi: Function) -> str:
+        # the algorithm/code/objective block is identical in every prompt that
+        # reuses the same individual, so render it once and cache it on the
+        # instance; Function.__setattr__ drops the cache if the fields change
+        block = indi.__dict__.get('_prompt_block')
+        if block is None:
+            block = f'{indi.algorithm}\n{str(indi)}\nObjective value: {str(-indi.score)}\n'
+            indi.__dict__['_prompt_block'] = block
+        return block
+
 
     @classmethod
     def get_prompt_i1(cls, task_prompt: str, template_function: Function):
-        # template
-        temp_func = copy.deepcopy(template_function)
-        temp_func.body = ''
         # create prompt content
         prompt_content = f'''{task_prompt}
 1. First, describe the design idea and main steps of your algorithm in one sentence. The description must be inside within boxed {{}}. 
 2. Next, implement the following Python function:
-{str(temp_func)}
+{cls._template_str(template_function)}
 Do not give additional explanations.'''
         return prompt_content
 
@@ -37,14 +57,12 @@ Do not give additional explanations.'''
     def get_prompt_e1(cls, task_prompt: str, indivs: List[Function], template_function: Function):
         for indi in indivs:
             assert hasattr(indi, 'algorithm')
-        # template
-        temp_func = copy.deepcopy(template_function)
-        temp_func.body = ''
         # create prompt content for all individuals
-        indivs_prompt = ''
+        indivs_parts = []
         for i, indi in enumerate(indivs):
             indi.docstring = ''
-            indivs_prompt += f'No. {i + 1} algorithm and the corresponding code are:\n{indi.algorithm}\n{str(indi)}\nObjective value: {str(-indi.score)}\n'
+            indivs_parts.append(f'No. {i + 1} algorithm and the corresponding code are:\n{cls._indi_block(indi)}')
+        indivs_prompt = ''.join(indivs_parts)
         # create prmpt content
         prompt_content = f'''{task_prompt}
 I have {len(indivs)} existing algorithms with their codes as follows:
@@ -52,7 +70,7 @@ I have {len(indivs)} existing algorithms with their codes as follows:
 Please create a new algorithm that has a totally different form from the given algorithms. Try generating codes with different structures, flows or algorithms. The new algorithm should have a relatively low objective value.
 1. First, describe the design idea and main steps of your algorithm in one sentence. The description must be inside within boxed {{}}.
 2. Next, implement the idea in the following Python function:
-{str(temp_func)}
+{cls._template_str(template_function)}
 Do not give additional explanations.'''
         return prompt_content
 
@@ -61,14 +79,12 @@ Do not give additional explanations.'''
         for indi in indivs:
             assert hasattr(indi, 'algorithm')
 
-        # template
-        temp_func = copy.deepcopy(template_function)
-        temp_func.body = ''
         # create prompt content for all individuals
-        indivs_prompt = ''
+        indivs_parts = []
         for i, indi in enumerate(indivs):
             indi.docstring = ''
-            indivs_prompt += f'No. {i + 1} algorithm and the corresponding code are:\n{indi.algorithm}\n{str(indi)}\nObjective value: {str(-indi.score)}\n'
+            indivs_parts.append(f'No. {i + 1} algorithm and the corresponding code are:\n{cls._indi_block(indi)}')
+        indivs_prompt = ''.join(indivs_parts)
         # create prmpt content
         prompt_content = f'''{task_prompt}
 I have {len(indivs)} existing algorithms with their codes as follows:
@@ -77,16 +93,13 @@ Please create a new algorithm that has a similar form to the No.{len(indivs)} al
 1. Firstly, list the common ideas in the No.{1} algorithm that may give good performances.
 2. Secondly, based on the common idea, describe the design idea based on the No.{len(indivs)} algorithm and main steps of your algorithm in one sentence. The description must be inside within boxed {{}}.
 3. Thirdly, implement the idea in the following Python function:
-{str(temp_func)}
+{cls._template_str(template_function)}
 Do not give additional explanations.'''
         return prompt_content
 
     @classmethod
     def get_prompt_m1(cls, task_prompt: str, indi: Function, template_function: Function):
         assert hasattr(indi, 'algorithm')
-        # template
-        temp_func = copy.deepcopy(template_function)
-        temp_func.body = ''
 
         # create prmpt content
         prompt_content = f'''{task_prompt}
@@ -97,16 +110,13 @@ Code:
 Please create a new algorithm that has a different form but can be a modified version of the provided algorithm. Attempt to introduce more novel mechanisms and new equations or programme segments.
 1. First, describe your new algorithm and main steps in one sentence. The description must be inside within boxed {{}}.
 2. Next, implement the idea in the following Python function:
-{str(temp_func)}
+{cls._template_str(template_function)}
 Do not give additional explanations.'''
         return prompt_content
 
     @classmethod
     def get_prompt_m2(cls, task_prompt: str, indi: Function, template_function: Function):
         assert hasattr(indi, 'algorithm')
-        # template
-        temp_func = copy.deepcopy(template_function)
-        temp_func.body = ''
         # create prmpt content
         prompt_content = f'''{task_prompt}
 I have one algorithm with its code as follows. Algorithm description:
@@ -116,7 +126,7 @@ Code:
 Please identify the main algorithm parameters and help me in creating a new algorithm that has different parameter settings to equations compared to the provided algorithm.
 1. First, describe your new algorithm and main steps in one sentence. The description must be inside within boxed {{}}.
 2. Next, implement the idea in the following Python function:
-{str(temp_func)}
+{cls._template_str(template_function)}
 Do not give additional explanations.'''
         return prompt_content
 
@@ -125,14 +135,12 @@ Do not give additional explanations.'''
         for indi in indivs:
             assert hasattr(indi, 'algorithm')
 
-        # template
-        temp_func = copy.deepcopy(template_function)
-        temp_func.body = ''
         # create prompt content for all individuals
-        indivs_prompt = ''
+        indivs_parts = []
         for i, indi in enumerate(indivs):
             indi.docstring = ''
-            indivs_prompt += f"No. {i + 1} algorithm's description and the corresponding code are:\n{indi.algorithm}\n{str(indi)}\nObjective value: {str(-indi.score)}\n"
+            indivs_parts.append(f"No. {i + 1} algorithm's description and the corresponding code are:\n{cls._indi_block(indi)}")
+        indivs_prompt = ''.join(indivs_parts)
         # create prmpt content
         prompt_content = f'''{task_prompt}
 I have {len(indivs)} existing algorithms with their codes as follows:
@@ -141,6 +149,6 @@ Please help me create a new algorithm that is inspired by all the above algorith
 1. Firstly, list some ideas in the provided algorithms that are clearly helpful to a better algorithm.
 2. Secondly, based on the listed ideas, describe the design idea and main steps of your new algorithm in one sentence. The description must be inside within boxed {{}}.
 3. Thirdly, implement the idea in the following Python function:
-{str(temp_func)}
+{cls._template_str(template_function)}
 Do not give additional explanations.'''
         return prompt_content
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import logging
 import math
+import random
 from threading import Lock
 from typing import List
 import numpy as np
-import traceback
 from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
 from pymoo.operators.survival.rank_and_crowding.metrics import get_crowding_function
 from pymoo.util.randomized_argsort import randomized_argsort
 
 from ...base import *
 
+# shared, stateless w.r.t. .do(); constructing them per survival event just
+# re-runs pymoo's factory dispatch
+nds_sorting = NonDominatedSorting()
+crowding_func = get_crowding_function("cd")
+
 
 class Population:
     def __init__(self, pop_size, generation=0, pop: List[Function] | Population | None = None):
@@ -23,9 +29,15 @@ class Population:
 
         self._pop_size = pop_size
         self._lock = Lock()
+        self._survival_lock = Lock()
         self._next_gen_pop = []
         self._elitist = []
         self._generation = generation
+        # rank/crowding live in arrays aligned with _population rather than as
+        # attributes on the Function objects (structure-of-arrays layout)
+        self._ranks = np.zeros(len(self._population), dtype=np.intp)
+        self._crowdings = np.zeros(len(self._population), dtype=np.float64)
+        self._rebuild_dup_index()
 
     def __len__(self):
         return len(self._population)
@@ -52,118 +64,171 @@ class Population:
         # we only accept valid functions
         if func.score is None:
             return
-        try:
-            self._lock.acquire()
+        with self._lock:
             # register to next_gen
             if not self.has_duplicate_function(func):
                 self._next_gen_pop.append(func)
+                self._dup_index.setdefault(str(func), []).append((self._next_gen_pop, len(self._next_gen_pop) - 1))
 
             # update: perform survival if reach the pop size
             if len(self._next_gen_pop) >= self._pop_size or (len(self._next_gen_pop) >= self._pop_size//5 and self._generation == 0):
-                pop = self._population + self._next_gen_pop
+                # swap the filled batch out so other evaluators can keep
+                # registering while this thread sorts it outside the lock
+                candidates = self._next_gen_pop
+                self._next_gen_pop = []
+            else:
+                candidates = None
 
-                pop_elitist = pop + self._elitist
-                objs = [ind.score for ind in pop_elitist]
-                objs_array = -np.array(objs)
-                nondom_idx = NonDominatedSorting().do(objs_array, only_non_dominated_front=True)
-                self._elitist = []
-                for idx in nondom_idx.tolist():
-                    self._elitist.append(pop_elitist[idx])
+        # with pop_size < 5 the generation-0 trigger fires on every call, so
+        # the swapped batch can legitimately be empty: nothing to sort then
+        if not candidates:
+            return
 
-                # modified from pymoo.algorithms.moo.nsga2
-                # get the objective space values and objects
-                objs = [ind.score for ind in pop]
-                F = -np.array(objs)
+        # one survival pass at a time; the main lock is only reacquired for
+        # the snapshot and the final commit, so evaluators are never blocked
+        # behind the O(N*M) sorting work
+        with self._survival_lock:
+            with self._lock:
+                pop = self._population + candidates
+                elitist = self._elitist
+
+            try:
+                population, ranks, crowdings, elitist = self._survival(pop, elitist)
+            except Exception:
+                # a failed survival pass degrades convergence silently, so
+                # make it visible to the driver instead of swallowing it
+                logging.exception('nsga2 survival pass failed; keeping previous population')
+                # put the swapped-out batch back so the candidates are retried
+                # on the next registration instead of being discarded, and so
+                # the duplicate index no longer points at the orphaned list
+                with self._lock:
+                    self._next_gen_pop = candidates + self._next_gen_pop
+                    self._rebuild_dup_index()
+                return
+
+            with self._lock:
+                self._population = population
+                self._ranks = ranks
+                self._crowdings = crowdings
+                self._elitist = elitist
+                self._generation += 1
+                self._rebuild_dup_index()
 
-                # the final indices of surviving individuals
-                survivors = []
+    def _survival(self, pop: List[Function], elitist: List[Function]):
+        # note: even when the whole pop fits the survivor quota the sorting
+        # pass cannot be skipped, because selection() relies on the rank and
+        # crowding attributes it assigns; only the empty case is trivial
+        if not pop:
+            return pop, np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float64), elitist
 
-                # do the non-dominated sorting until splitting front
-                fronts = NonDominatedSorting().do(F, n_stop_if_ranked=self._pop_size)
+        pop_elitist = pop + elitist
+        objs = [ind.score for ind in pop_elitist]
+        objs_array = -np.array(objs)
+        nondom_idx = nds_sorting.do(objs_array, only_non_dominated_front=True)
+        elitist = []
+        for idx in nondom_idx.tolist():
+            elitist.append(pop_elitist[idx])
 
-                for k, front in enumerate(fronts):
+        # modified from pymoo.algorithms.moo.nsga2
+        # get the objective space values and objects;
+        # pop_elitist starts with pop, so its rows are already in objs_array
+        F = objs_array[:len(pop)]
 
-                    I = np.arange(len(front))
+        # the final indices of surviving individuals
+        survivors = []
 
-                    # current front sorted by crowding distance if splitting
-                    if len(survivors) + len(I) > self._pop_size // 5:
+        # per-slot rank and crowding, filled front by front
+        ranks = np.empty(len(pop), dtype=np.intp)
+        crowdings = np.empty(len(pop), dtype=np.float64)
 
-                        # Define how many will be removed
-                        n_remove = len(survivors) + len(front) - self._pop_size // 5
+        # do the non-dominated sorting until splitting front
+        fronts = nds_sorting.do(F, n_stop_if_ranked=self._pop_size)
 
-                        # re-calculate the crowding distance of the front
-                        crowding_of_front = \
-                            get_crowding_function("cd").do(
-                                F[front, :],
-                                n_remove=n_remove
-                            )
+        for k, front in enumerate(fronts):
 
-                        I = randomized_argsort(crowding_of_front, order='descending', method='numpy')
-                        I = I[:-n_remove]
+            I = np.arange(len(front))
 
-                    # otherwise take the whole front unsorted
-                    else:
-                        # calculate the crowding distance of the front
-                        crowding_of_front = \
-                            get_crowding_function("cd").do(
-                                F[front, :],
-                                n_remove=0
-                            )
+            # current front sorted by crowding distance if splitting
+            if len(survivors) + len(I) > self._pop_size // 5:
 
-                    # save rank and crowding in the individual class
-                    for j, i in enumerate(front):
-                        pop[i].rank = k
-                        pop[i].crowding = crowding_of_front[j]
+                # Define how many will be removed
+                n_remove = len(survivors) + len(front) - self._pop_size // 5
 
-                    # extend the survivors by all or selected individuals
-                    survivors.extend(front[I])
+                # re-calculate the crowding distance of the front
+                crowding_of_front = \
+                    crowding_func.do(
+                        F[front, :],
+                        n_remove=n_remove
+                    )
 
-                self._population = [pop[i] for i in survivors]
-                self._next_gen_pop = []
-                self._generation += 1
-        except Exception as e:
-            traceback.print_exc()
-            return
-        finally:
-            self._lock.release()
+                I = randomized_argsort(crowding_of_front, order='descending', method='numpy')
+                I = I[:-n_remove]
+
+            # otherwise take the whole front unsorted
+            else:
+                # calculate the crowding distance of the front
+                crowding_of_front = \
+                    crowding_func.do(
+                        F[front, :],
+                        n_remove=0
+                    )
+
+            # save rank and crowding for every slot of the front at once
+            ranks[front] = k
+            crowdings[front] = crowding_of_front
+
+            # extend the survivors by all or selected individuals
+            survivors.extend(front[I])
+
+        return [pop[i] for i in survivors], ranks[survivors], crowdings[survivors], elitist
+
+    def _rebuild_dup_index(self):
+        # maps rendered source -> positions holding that function, so duplicate
+        # checks are a dict lookup instead of an O(N) scan under the lock
+        self._dup_index = {}
+        for i, f in enumerate(self._population):
+            self._dup_index.setdefault(str(f), []).append((self._population, i))
+        for i, f in enumerate(self._next_gen_pop):
+            self._dup_index.setdefault(str(f), []).append((self._next_gen_pop, i))
 
     def has_duplicate_function(self, func: str | Function) -> bool:
         if func.score is None:
             return True
 
-        for i in range(len(self._population)):
-            f = self._population[i]
-            if str(f) == str(func):
-                if func.score[0] > f.score[0]:
-                    self._population[i] = func
-                    return True
-                if func.score[0] == f.score[0] and func.score[1] > f.score[1]:
-                    self._population[i] = func
-                    return True
-
-        for i in range(len(self._next_gen_pop)):
-            f = self._next_gen_pop[i]
-            if str(f) == str(func):
+        entries = self._dup_index.get(str(func))
+        if entries:
+            for container, i in entries:
+                f = container[i]
                 if func.score[0] > f.score[0]:
-                    self._next_gen_pop[i] = func
+                    container[i] = func
                     return True
                 if func.score[0] == f.score[0] and func.score[1] > f.score[1]:
-                    self._next_gen_pop[i] = func
+                    container[i] = func
                     return True
         return False
 
     def selection(self) -> Function:
         # funcs = [f for f in self._population if not math.isinf(f.score)]
-        funcs = [f for f in self._population if not np.isinf(np.array(f.score)).any()]
-        if len(funcs) > 1:
-            parents = np.random.choice(funcs, size=2, replace=False)
-            if parents[0].rank < parents[1].rank:
-                return parents[0]
-            elif parents[0].rank > parents[1].rank:
-                return parents[1]
-            elif parents[0].crowding > parents[1].crowding:
-                return parents[0]
+        # snapshot the population together with its aligned rank/crowding
+        # arrays so a concurrent survival swap cannot mix generations
+        with self._lock:
+            population = self._population
+            ranks = self._ranks
+            crowdings = self._crowdings
+        # one vectorized isinf pass instead of allocating an ndarray per individual
+        scores = np.array([f.score for f in population], dtype=np.float64).reshape(len(population), -1)
+        valid = np.nonzero(~np.isinf(scores).any(axis=1))[0]
+        if len(valid) > 1:
+            # random.sample is much cheaper than np.random.choice(replace=False)
+            # for drawing two parents from a small index set
+            i, j = random.sample(valid.tolist(), 2)
+            if ranks[i] < ranks[j]:
+                return population[i]
+            elif ranks[i] > ranks[j]:
+                return population[j]
+            elif crowdings[i] > crowdings[j]:
+                return population[i]
             else:
-                return parents[1]
+                return population[j]
         else:
-            return funcs[0]
+            return population[valid[0]]
